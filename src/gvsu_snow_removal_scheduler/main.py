@@ -1,9 +1,87 @@
-import argparse
+import functools
+import hashlib
+import itertools
 import json
+import os
+import random
 import sys
-from typing import Any, Optional
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Any, NamedTuple, NoReturn, Optional
+
+# gspread is imported where it is used, since importing it is slow and isn't
+# needed for sheets built from data= or loaded from the cache
+if TYPE_CHECKING:
+    import gspread
+
+WEEKDAYS: tuple[str, ...] = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+_VALID_DAYS: frozenset[str] = frozenset(WEEKDAYS)
+TEAM_SIZE: int = 6
+
+# API errors worth retrying, and how many tries a request gets in total
+_RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 503})
+_ATTEMPTS: int = 5
+
+# Interned so comparisons against the interned record values can match on identity
+_LEADER: str = sys.intern("Leader")
+_VARSITY: str = sys.intern("Varsity")
+
+# Each load of a sheet's data gets a new number, so cached results computed
+# against a sheet can tell whether its data has changed since
+_GENERATIONS: Iterator[int] = itertools.count()
+
+
+def _numericise(value: Any) -> Any:
+    """
+    Converts a cell that reads as a number into an int or float.
+
+    Matches gspread's numericise() as used by get_all_records(), without
+    having to import gspread for cached worksheets.
+
+    Args:
+        value: The formatted cell value
+
+    Returns:
+        The cell as an int or float if it reads as one, otherwise unchanged
+    """
+
+    if isinstance(value, str) and "_" not in value:
+        # Drops the commas separating thousands, like "1,200"
+        cleaned: str = value.replace(",", "")
+        try:
+            return int(cleaned)
+        except ValueError:
+            try:
+                return float(cleaned)
+            except ValueError:
+                pass
 
-import gspread
+    return value
+
+
+class _Candidate(NamedTuple):
+    """
+    A person available on a day along with their records.
+
+    The field names match the keys of the dictionaries availability() returns,
+    so `_asdict()` gives the same dictionary.
+    """
+
+    Name: str
+    Completed: Any
+    Experience: str
+    Position: str
 
 
 class Sheet:
@@ -18,13 +96,24 @@ class Sheet:
         __api_key: Path to the Google Sheets API key
         __sheet_name: Name of the Google Sheet
         __worksheet_name: Name of the worksheet to access within the spreadsheet
+        __cache_ttl: Seconds a cached worksheet stays fresh, None disables caching
+        __cache_dir: Directory the cached worksheets are stored in
         __sheet: List of dictionaries containing the worksheet records
+        __records_index: Cached lookup of rows by lowercased Name, built on demand
+        __columns: Cached columns of the sheet by header, built on demand
+        __by_day: Rows grouped by each day of the week they are available
+        __generation: Number identifying the currently loaded data
+        __duplicates_cache: Cached result of duplicates(), None until computed
+        __missing_cache: Cached result of missing() and the records generation it used
 
     Public Methods:
         update(): updates the internal sheet
         duplicates(): Finds duplicate Name entries
         missing(other): Validates the respondent exist in the sheet's records
+        validate(other): Finds missing and duplicated respondents in one pass
         availability(other, day): Gets people available on a specific day with removal counts
+        availability_for_week(other): Gets availability and teams for every day at once
+        write_team(day, team): Writes a day's team to the worksheet
 
     Properties:
         sheet: Returns the raw worksheet data as a list of dictionaries
@@ -36,24 +125,33 @@ class Sheet:
         sheet_name: Optional[str] = None,
         worksheet_name: Optional[str] = None,
         data: Optional[list[dict[str, Any]]] = None,
+        cache_ttl: Optional[int] = None,
+        cache_dir: str = ".sheet_cache",
     ):
         self.__api_key: Optional[str] = api_key
         self.__sheet_name: Optional[str] = sheet_name
         self.__worksheet_name: Optional[str] = worksheet_name
+        self.__cache_ttl: Optional[int] = cache_ttl
+        self.__cache_dir: str = cache_dir
 
         if data is not None:
-            self.__sheet = data
+            for row in data:
+                self._normalize(row)
+            self._load(data)
         else:
-            self.__sheet = []
+            self._load([])
 
     def update(self) -> list[dict[str, Any]]:
         """
         Gets the Google Sheet data from the Google Sheet API and updates the internal sheet.
 
+        If a cache TTL was given, a cached copy of the worksheet younger than the TTL
+        is used instead of calling the API, and fresh API results are cached.
+
         Returns:
             List of dictionaries where each dictionary represents a row with
             column headers as keys. Returns empty list if an error occurs.
-            For "Responses" worksheet, the "Days" field is converted to a list
+            For "Responses" worksheet, the "Days" field is converted to a frozenset
             and the "Replacement" field is removed (it is just a check that acknowledges
             they will find a replacement if they cannot make a day they signed up for).
 
@@ -62,6 +160,81 @@ class Sheet:
             FileNotFoundError: If the API key file does not exist.
             ValueError: If the specified spreadsheet does not exist.
             ValueError: If the specified worksheet does not exist.
+            ValueError: If the worksheet's header row has duplicate headers.
+        """
+
+        # Checks the worksheet can be reached before using the cache or the API
+        self._names()
+
+        values: Optional[list[list[Any]]] = self._read_cache()
+        if values is None:
+            values = self._fetch()
+            self._write_cache(values)
+
+        sheet: list[dict[str, Any]] = []
+
+        if values != []:
+            # The first row holds the column headers, the API leaves out trailing
+            # empty cells so shorter rows are padded to match the headers. Cells
+            # that read as numbers are converted like get_all_records() does
+            headers, *rows = values
+            width: int = len(headers)
+
+            # Rows are keyed by header, so a repeated header would hide a column
+            if repeated := sorted(
+                header for header, count in Counter(headers).items() if count > 1
+            ):
+                raise ValueError(
+                    f"Worksheet '{self.__worksheet_name}' has duplicate headers: "
+                    f"{', '.join(map(str, repeated))}"
+                )
+
+            padded: Iterable[Sequence[Any]] = (
+                [*map(_numericise, cells), *[""] * (width - len(cells))]
+                for cells in rows
+            )
+
+            if self.__worksheet_name == "Responses" and "Replacement" in headers:
+                # The replacement column is just a checkbox that acknowledges they
+                # must find a replacement if they cannot make a day they sign up for
+                keep: list[int] = [
+                    i for i, header in enumerate(headers) if header != "Replacement"
+                ]
+                headers = [headers[i] for i in keep]
+                padded = ([cells[i] for i in keep] for cells in padded)
+
+            # Builds and normalizes each row in a single pass
+            sheet = [self._normalize(dict(zip(headers, cells))) for cells in padded]
+
+        self._load(sheet)
+        return self.__sheet
+
+    def _load(self, sheet: list[dict[str, Any]]) -> None:
+        """
+        Replaces the internal sheet with normalized rows and resets everything
+        derived from the previous rows.
+
+        Args:
+            sheet: The normalized rows
+        """
+
+        self.__sheet: list[dict[str, Any]] = sheet
+        self.__by_day: dict[str, list[dict[str, Any]]] = self._bucket_days(sheet)
+        self.__generation: int = next(_GENERATIONS)
+        self.__records_index: Optional[dict[str, dict[str, Any]]] = None
+        self.__columns: dict[str, list[Any]] = {}
+        self.__duplicates_cache: Optional[set[str]] = None
+        self.__missing_cache: Optional[tuple[int, set[str]]] = None
+
+    def _names(self) -> tuple[str, str, str]:
+        """
+        Gets the names needed to reach the worksheet, checking they were all given.
+
+        Returns:
+            A Tuple of the API key path, sheet name, and worksheet name
+
+        Raises:
+            ValueError: If `__api_key`, `__sheet_name`, or `__worksheet_name` is None.
         """
 
         if not self.__api_key or not self.__sheet_name or not self.__worksheet_name:
@@ -69,61 +242,279 @@ class Sheet:
                 "API key, sheet name, and worksheet name must all be provided"
             )
 
+        return self.__api_key, self.__sheet_name, self.__worksheet_name
+
+    def _fetch(self) -> list[list[Any]]:
+        """
+        Gets the raw worksheet values from the Google Sheet API.
+
+        The whole worksheet is read with a single values request instead of
+        looking up the worksheet and calling get_all_records(), which saves a
+        round trip. Cells come back formatted, as strings, and are turned into
+        numbers by update() the same way get_all_records() would.
+
+        Returns:
+            List of rows, each a list of formatted cell values, starting with the
+            header row
+
+        Raises:
+            FileNotFoundError: If the API key file does not exist.
+            ValueError: If the specified spreadsheet does not exist.
+            ValueError: If the specified worksheet does not exist.
+        """
+
+        import gspread
+
+        worksheet_name: str = self._names()[2]
+        response: dict[str, Any] = self._request(
+            lambda spreadsheet: spreadsheet.values_get(
+                gspread.utils.absolute_range_name(worksheet_name)
+            )
+        )
+        return response.get("values", [])
+
+    def _request(self, call: Callable[["gspread.Spreadsheet"], Any]) -> Any:
+        """
+        Opens the Google Sheet and makes a request against it.
+
+        Requests failing with a rate limit or server error are retried with
+        exponential backoff, up to _ATTEMPTS tries in total.
+
+        Args:
+            call: Function that makes the request given the opened spreadsheet
+
+        Returns:
+            Whatever the request returns
+
+        Raises:
+            FileNotFoundError: If the API key file does not exist.
+            ValueError: If the specified spreadsheet does not exist.
+            ValueError: If the specified worksheet does not exist.
+        """
+
+        import gspread
+
+        api_key: str
+        sheet_name: str
+        worksheet_name: str
+        api_key, sheet_name, worksheet_name = self._names()
+        attempt: int = 0
+
+        while True:
+            try:
+                # Needed logic to get data from the Google Sheet API
+                client: gspread.Client = gspread.service_account(filename=api_key)
+                spreadsheet: gspread.Spreadsheet = client.open(sheet_name)
+                return call(spreadsheet)
+
+            # Returns more readable errors
+            except FileNotFoundError:
+                raise FileNotFoundError(f"API key file '{api_key}' not found")
+            except gspread.exceptions.SpreadsheetNotFound:
+                raise ValueError(f"Spreadsheet '{sheet_name}' not found")
+            except gspread.exceptions.APIError as e:
+                # Rate limits and server errors are usually temporary, so waits
+                # longer after each failure (with jitter so retries don't line up)
+                attempt += 1
+                if e.response.status_code in _RETRY_STATUSES and attempt < _ATTEMPTS:
+                    time.sleep(2 ** (attempt - 1) + random.random())
+                    continue
+
+                # A range naming a worksheet that doesn't exist can't be parsed,
+                # any other bad request is raised as is
+                if e.code == 400 and str(e.error.get("message", "")).startswith(
+                    "Unable to parse range"
+                ):
+                    raise ValueError(f"Worksheet '{worksheet_name}' not found")
+                raise
+
+    def _cache_path(self) -> str:
+        """
+        Gets the path of the cache file for this sheet's worksheet.
+
+        Returns:
+            Path of the JSON cache file, keyed by the sheet and worksheet names
+        """
+
+        key: str = hashlib.sha1(
+            f"{self.__sheet_name}/{self.__worksheet_name}".encode()
+        ).hexdigest()
+        return os.path.join(self.__cache_dir, f"{key}.json")
+
+    def _read_cache(self) -> Optional[list[list[Any]]]:
+        """
+        Reads the cached worksheet values if caching is enabled and they are fresh.
+
+        Returns:
+            The cached raw values, or None if there is no usable cached copy
+        """
+
+        if self.__cache_ttl is None:
+            return None
+
+        path: str = self._cache_path()
+        try:
+            if time.time() - os.path.getmtime(path) >= self.__cache_ttl:
+                return None
+            with open(path, "r") as cache:
+                return json.load(cache)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_cache(self, values: list[list[Any]]) -> None:
+        """
+        Atomically writes the raw worksheet values to the cache if caching is enabled.
+
+        Failing to write the cache is not an error, the next update() just
+        calls the API again.
+
+        Args:
+            values: The raw values returned by the API
+        """
+
+        if self.__cache_ttl is None:
+            return
+
         try:
-            # Needed logic to get data from the Google Sheet API
-            client: gspread.Client = gspread.service_account(filename=self.__api_key)
-            spreadsheet: gspread.Spreadsheet = client.open(self.__sheet_name)
-            worksheet: gspread.Worksheet = spreadsheet.worksheet(self.__worksheet_name)
-            sheet: list[dict[str, Any]] = worksheet.get_all_records()
-
-            if sheet != []:
-                for row in sheet:
-                    # Helps to normalize data by removing trailing whitespace
-                    row["Name"] = row["Name"].strip()
-                    if self.__worksheet_name == "Responses":
-                        # Turns the "Days" response into a list for easier processing
-                        row["Days"] = [day.strip() for day in row["Days"].split(",")]
-
-                        # The replacement row is just a checkbox that acknowledges they must
-                        # find a replacement if they cannot make a day they sign up for
-                        del row["Replacement"]
-
-            self.__sheet = sheet
-            return self.__sheet
-
-        # Returns more readable errors
-        except FileNotFoundError:
-            raise FileNotFoundError(f"API key file '{self.__api_key}' not found")
-        except gspread.exceptions.SpreadsheetNotFound:
-            raise ValueError(f"Spreadsheet '{self.__sheet_name}' not found")
-        except gspread.exceptions.WorksheetNotFound:
-            raise ValueError(f"Worksheet '{self.__worksheet_name}' not found")
+            os.makedirs(self.__cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.__cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as cache:
+                    json.dump(values, cache)
+                os.replace(tmp_path, self._cache_path())
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    @staticmethod
+    def _normalize(row: dict[str, Any]) -> dict[str, Any]:
+        """
+        Normalizes a row in place.
+
+        Strips surrounding whitespace from "Name" and caches its lowercased form
+        under "_name_lc" so comparisons don't have to lowercase it every time.
+        "Days", whether a comma separated response or already a list of days,
+        is turned into a frozenset of days. "Position" and "Experience" are
+        interned since they only ever hold a few distinct values.
+
+        Returns:
+            The same row, so it can be used inside comprehensions
+        """
+
+        row["Name"] = row["Name"].strip()
+        row["_name_lc"] = row["Name"].lower()
+
+        # Turns the "Days" response into a set for easier processing
+        days: Any = row.get("Days")
+        if isinstance(days, str):
+            row["Days"] = frozenset(day.strip() for day in days.split(","))
+        elif days is not None and not isinstance(days, frozenset):
+            row["Days"] = frozenset(days)
+
+        # Lets comparisons against _LEADER and _VARSITY short-circuit on identity
+        for category in ("Position", "Experience"):
+            if isinstance(row.get(category), str):
+                row[category] = sys.intern(row[category])
+
+        return row
+
+    @staticmethod
+    def _bucket_days(sheet: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+        """
+        Groups rows by the days of the week they list under "Days".
+
+        Rows without a "Days" field (such as records) are left out.
+
+        Returns:
+            Dictionary mapping each day of the week to the rows available that day
+        """
+
+        by_day: dict[str, list[dict[str, Any]]] = {day: [] for day in WEEKDAYS}
+
+        for row in sheet:
+            for day in row.get("Days", ()):
+                if day in by_day:
+                    by_day[day].append(row)
+
+        return by_day
+
+    def _get_index(self) -> dict[str, dict[str, Any]]:
+        """
+        Gets the lookup of this sheet's rows keyed by lowercased Name.
+
+        The lookup is built the first time it is needed and reused until the
+        next update(), so repeated availability() calls don't rebuild it.
+
+        Returns:
+            Dictionary mapping each lowercased Name to its row
+        """
+
+        if self.__records_index is None:
+            self.__records_index = {row["_name_lc"]: row for row in self.__sheet}
+
+        return self.__records_index
+
+    def _column(self, key: str) -> list[Any]:
+        """
+        Gets one column of the sheet as a list.
+
+        Columns are built the first time they are needed and reused until the
+        next update(), so set and counting operations can run over a whole
+        column at once.
+
+        Args:
+            key: The column header
+
+        Returns:
+            List of that column's value for every row, in row order
+        """
+
+        if key not in self.__columns:
+            self.__columns[key] = list(map(itemgetter(key), self.__sheet))
+
+        return self.__columns[key]
 
     def duplicates(self) -> set[str]:
         """
         Finds duplicated responses
 
+        The result is cached until the next update().
+
         Returns:
-            Set of names that exist multiple times in responses.
+            Set of names that exist multiple times in responses, each spelled as
+            in that person's first response.
         """
 
-        people: set[str] = set()
-        duplicated: set[str] = set()
+        if self.__duplicates_cache is not None:
+            return set(self.__duplicates_cache)
 
-        # Records people to find duplicates, and adds them to set
-        for entry in self.__sheet:
-            person = entry["Name"]
-            if person.lower() in people:
-                duplicated.add(person)
-            else:
-                people.add(person.lower())
+        # Counts how many times each person responded
+        counts: Counter[str] = Counter(self._column("_name_lc"))
+        repeated: set[str] = {person for person, count in counts.items() if count > 1}
 
-        return duplicated
+        # Remembers how duplicated people first wrote their name
+        # (iterating in reverse lets the first one win)
+        duplicated: set[str] = set()
+        if repeated:
+            first: dict[str, str] = {
+                entry["_name_lc"]: entry["Name"]
+                for entry in reversed(self.__sheet)
+                if entry["_name_lc"] in repeated
+            }
+            duplicated = set(first.values())
+
+        self.__duplicates_cache = duplicated
+        return set(duplicated)
 
     def missing(self, other: "Sheet") -> set[str]:
         """
         Compares this sheet's respondents against another sheet's records.
 
+        The result is cached until either sheet is updated or a different
+        records sheet is given.
+
         Args:
             other: Sheet object containing user records to validate against
 
@@ -131,16 +522,62 @@ class Sheet:
             Set of names that exist in responses but not in the records.
         """
 
+        if self.__missing_cache is not None:
+            generation, cached = self.__missing_cache
+            if generation == other.__generation:
+                return set(cached)
+
+        # Finds the people missing from records with set operations on the name
+        # columns, and only looks up how they wrote their name if there are any
+        absent: set[str] = set(self._column("_name_lc")).difference(
+            other._column("_name_lc")
+        )
+        missing: set[str] = set()
+        if absent:
+            missing = {
+                response["Name"]
+                for response in self.__sheet
+                if response["_name_lc"] in absent
+            }
+
+        self.__missing_cache = (other.__generation, missing)
+        return set(missing)
+
+    def validate(self, other: "Sheet") -> tuple[set[str], set[str]]:
+        """
+        Finds respondents missing from another sheet's records and duplicated
+        responses in a single pass over this sheet.
+
+        Gives the same results as missing() and duplicates(), and caches them
+        for those methods.
+
+        Args:
+            other: Sheet object containing user records to validate against
+
+        Returns:
+            A Tuple containing the following:
+                Set of names that exist in responses but not in the records
+                Set of names that exist multiple times in responses
+        """
+
+        lookup: dict[str, dict[str, Any]] = other._get_index()
+        first: dict[str, str] = {}
         missing: set[str] = set()
-        lookup: set[str] = set(entry["Name"].lower() for entry in other.__sheet)
+        duplicated: set[str] = set()
 
-        # Adds people missing from records to set
+        # Checks each respondent against the records and the people seen so far
         for response in self.__sheet:
-            respondent: str = response["Name"]
-            if respondent.lower() not in lookup:
-                missing.add(respondent)
+            person: str = response["_name_lc"]
+            if person not in lookup:
+                missing.add(response["Name"])
+            if person in first:
+                duplicated.add(first[person])
+            else:
+                first[person] = response["Name"]
 
-        return missing
+        self.__missing_cache = (other.__generation, missing)
+        self.__duplicates_cache = duplicated
+        return set(missing), set(duplicated)
 
     def availability(
         self, other: "Sheet", day: str
@@ -162,69 +599,155 @@ class Sheet:
                 The optimal list for who can make the day
         """
 
-        if day not in (
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ):
+        if day not in _VALID_DAYS:
             raise ValueError(f"Invalid day: {day}. Must be a day of the week.")
 
-        # Store results and builds a lookup dictionary for peoples records
-        results: list[dict[str, Any]] = []
-        lookup: dict[str, dict[str, Any]] = {
-            entry["Name"].lower(): {
-                "Completed": entry["Completed"],
-                "Experience": entry["Experience"],
-                "Position": entry["Position"],
-            }
-            for entry in other.__sheet
-        }
+        results: list[_Candidate]
+        team: Optional[list[str]]
+        results, team = self._schedule(other._get_index(), day)
+
+        if team is None:
+            raise ValueError(f"No leader available for {day}")
+
+        return [result._asdict() for result in results], team
+
+    def availability_for_week(
+        self, other: "Sheet"
+    ) -> dict[str, tuple[list[dict[str, Any]], Optional[list[str]]]]:
+        """
+        Lists the available people and the optimal team for every day of the week.
+
+        Gives the same results as calling availability() for each day, but
+        shares the records lookup across all seven days.
+
+        Args:
+            other: Sheet object containing user records to check against
+
+        Returns:
+            Dictionary mapping every day of the week to the same Tuple availability()
+            returns for that day. On days with no leader available the team is None
+            instead of raising, so one such day doesn't hide the rest of the week.
+        """
+
+        lookup: dict[str, dict[str, Any]] = other._get_index()
+        week: dict[str, tuple[list[dict[str, Any]], Optional[list[str]]]] = {}
+
+        for day in WEEKDAYS:
+            results: list[_Candidate]
+            team: Optional[list[str]]
+            results, team = self._schedule(lookup, day)
+            week[day] = ([result._asdict() for result in results], team)
+
+        return week
+
+    def _schedule(
+        self, lookup: dict[str, dict[str, Any]], day: str
+    ) -> tuple[list[_Candidate], Optional[list[str]]]:
+        """
+        Finds the available people and picks the team for a day.
+
+        Args:
+            lookup: Records keyed by lowercased Name, from _get_index()
+            day: The day of the week to check, already validated
+
+        Returns:
+            A Tuple containing the following:
+                The people available on the day, sorted by snow removals done
+                The optimal team for the day, or None if no leader is available
+        """
+
+        # Store results
+        results: list[_Candidate] = []
 
         # Adds all the people and their records who are available on the day to the results
-        for response in self.__sheet:
-            if day in response["Days"]:
-                if record := lookup.get(response["Name"].lower()):
-                    results.append(
-                        {
-                            "Name": response["Name"],
-                            "Completed": record["Completed"],
-                            "Experience": record["Experience"],
-                            "Position": record["Position"],
-                        }
+        for response in self.__by_day[day]:
+            if record := lookup.get(response["_name_lc"]):
+                results.append(
+                    _Candidate(
+                        response["Name"],
+                        record["Completed"],
+                        record["Experience"],
+                        record["Position"],
                     )
+                )
 
         # Sorts the list by snow removals done
-        results.sort(key=lambda x: x["Completed"])
+        results.sort(key=attrgetter("Completed"))
 
-        team: list[str] = []
+        leader: Optional[str] = None
+        members: list[str] = []
         novices: int = 0
 
-        # Gets the team leader for the group
+        # Picks the team leader and the rest of the team in a single pass,
+        # stopping as soon as both are filled
         for result in results:
-            if result["Position"] == "Leader":
-                team.append(result["Name"])
+            if result.Position == _LEADER:
+                if leader is None:
+                    leader = result.Name
+            elif len(members) < TEAM_SIZE - 1:
+                if result.Experience == _VARSITY:
+                    members.append(result.Name)
+                elif novices < 3:
+                    members.append(result.Name)
+                    novices += 1
+
+            if leader is not None and len(members) == TEAM_SIZE - 1:
                 break
 
-        if not team:
-            raise ValueError(f"No leader available for {day}")
+        if leader is None:
+            return results, None
 
-        # Builds the rest of the team list
-        for result in results:
-            if len(team) == 6:
-                break
-            elif result["Position"] == "Leader":
-                continue
-            elif result["Experience"] == "Varsity":
-                team.append(result["Name"])
-            elif novices < 3:
-                team.append(result["Name"])
-                novices += 1
+        return results, [leader, *members]
+
+    def write_team(self, day: str, team: list[str]) -> None:
+        """
+        Writes a day's team to this sheet's worksheet in a single request.
+
+        Each day of the week has its own column, Monday in column A through
+        Sunday in column G, with the day in the first row and the team below it.
+        Unused rows are blanked so a smaller team replaces a larger one cleanly.
+
+        Args:
+            day: The day of the week the team is for
+            team: The names of the team members, as returned by availability()
+
+        Raises:
+            ValueError: If `day` is not a day of the week.
+            ValueError: If `team` has more than TEAM_SIZE people.
+            ValueError: If `__api_key`, `__sheet_name`, or `__worksheet_name` is None.
+            FileNotFoundError: If the API key file does not exist.
+            ValueError: If the specified spreadsheet does not exist.
+            ValueError: If the specified worksheet does not exist.
+        """
+
+        if day not in _VALID_DAYS:
+            raise ValueError(f"Invalid day: {day}. Must be a day of the week.")
+
+        if len(team) > TEAM_SIZE:
+            raise ValueError(f"Team for {day} has more than {TEAM_SIZE} people")
+
+        worksheet_name: str = self._names()[2]
 
-        return results, team
+        import gspread
+
+        column: str = "ABCDEFG"[WEEKDAYS.index(day)]
+        cells: list[str] = [day, *team] + [""] * (TEAM_SIZE - len(team))
+        data: list[dict[str, Any]] = [
+            {
+                "range": gspread.utils.absolute_range_name(
+                    worksheet_name, f"{column}{row}"
+                ),
+                "values": [[value]],
+            }
+            for row, value in enumerate(cells, start=1)
+        ]
+
+        # Sends every cell in one batch update rather than one request per cell
+        self._request(
+            lambda spreadsheet: spreadsheet.values_batch_update(
+                body={"valueInputOption": "RAW", "data": data}
+            )
+        )
 
     @property
     def sheet(self) -> list[dict[str, Any]]:
@@ -239,10 +762,14 @@ class Sheet:
         return self.__sheet
 
 
+@functools.lru_cache(maxsize=1)
 def read_config() -> dict[str, Any]:
     """
     Reads and parses the configuration file.
 
+    The file is only read once, later calls return the same dictionary.
+    Call `read_config.cache_clear()` to read it again.
+
     Returns:
         Dictionary containing API key path, sheet name, and worksheet names
 
@@ -255,14 +782,120 @@ def read_config() -> dict[str, Any]:
         return json.load(config)
 
 
+_USAGE: str = """usage: main.py [-h] [-d DAY] [-v]
+
+options:
+  -h, --help         show this help message and exit
+  -d, --day DAY      Day to list (e.g. Monday)
+  -v, --verbose      Show debug output"""
+
+
+def _usage_error(message: str) -> NoReturn:
+    """
+    Prints the usage with an error message and exits like argparse does.
+
+    Args:
+        message: What was wrong with the arguments
+
+    Raises:
+        SystemExit: Always, with exit code 2.
+    """
+
+    print(f"{_USAGE}\n\nerror: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _parse_args(argv: list[str]) -> tuple[Optional[str], bool]:
+    """
+    Parses the command line arguments.
+
+    Done by hand rather than with argparse, since importing and building a
+    parser costs more than the two flags are worth on every run. Accepts the
+    same forms argparse would: -d DAY, -dDAY, -d=DAY, --day DAY, --day=DAY,
+    combined short flags like -vd DAY, and unambiguous long option prefixes
+    like --verb.
+
+    Args:
+        argv: The arguments after the program name
+
+    Returns:
+        A Tuple containing the following:
+            The day given with -d/--day, or None if it wasn't given
+            Whether -v/--verbose was given
+
+    Raises:
+        SystemExit: After printing the usage for -h/--help, or for invalid arguments.
+    """
+
+    day: Optional[str] = None
+    verbose: bool = False
+    args: Iterator[str] = iter(argv)
+
+    def next_day(option: str) -> str:
+        # Like argparse, a following option isn't taken as the day
+        value: Optional[str] = next(args, None)
+        if value is None or value.startswith("-"):
+            _usage_error(f"{option} expects a day")
+        return value
+
+    for arg in args:
+        if arg.startswith("--") and arg != "--":
+            name, has_value, value = arg.partition("=")
+            matches: list[str] = [
+                option
+                for option in ("--help", "--verbose", "--day")
+                if option.startswith(name)
+            ]
+            if len(matches) != 1:
+                _usage_error(f"unrecognized argument {arg}")
+
+            option: str = matches[0]
+            if option == "--day":
+                day = value if has_value else next_day(option)
+            elif has_value:
+                _usage_error(f"{option} doesn't take a value")
+            elif option == "--help":
+                print(_USAGE)
+                sys.exit(0)
+            else:
+                verbose = True
+
+        elif arg.startswith("-") and len(arg) > 1:
+            # Short flags can be combined, anything after -d is the day
+            for i, flag in enumerate(arg[1:], start=1):
+                if flag == "h":
+                    print(_USAGE)
+                    sys.exit(0)
+                elif flag == "v":
+                    verbose = True
+                elif flag == "d":
+                    # argparse only drops an "=" straight after -d, as in -d=DAY
+                    rest: str = arg[i + 1 :]
+                    if not rest:
+                        day = next_day("-d")
+                    elif i == 1:
+                        day = rest.removeprefix("=")
+                    else:
+                        day = rest
+                    break
+                else:
+                    _usage_error(f"unrecognized argument {arg}")
+
+        else:
+            _usage_error(f"unrecognized argument {arg}")
+
+    return day, verbose
+
+
 if __name__ == "__main__":
-    # Setup the parser
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-d", "--day", help="Day to list (e.g. Monday)")
-    parser.add_argument(
-        "-v", "--verbose", action="store_true", help="Show debug output"
-    )
-    args = parser.parse_args()
+    # Only the command line fetches sheets concurrently, so importing the
+    # library doesn't pay for this
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Parse the arguments
+    arg_day: Optional[str]
+    verbose: bool
+    arg_day, verbose = _parse_args(sys.argv[1:])
 
     # Read config
     try:
@@ -277,15 +910,22 @@ if __name__ == "__main__":
             config["api_key_path"],
             config["sheet_name"],
             config["worksheets"]["responses"],
+            cache_ttl=config.get("cache_ttl"),
         )
-        responses.update()
 
         records = Sheet(
             config["api_key_path"],
             config["sheet_name"],
             config["worksheets"]["records"],
+            cache_ttl=config.get("cache_ttl"),
         )
-        records.update()
+
+        # Fetches both worksheets at the same time since each is a separate API call,
+        # result() re-raises any error from the fetch so it is handled below
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(sheet.update) for sheet in (responses, records)]
+            for future in futures:
+                future.result()
 
     except (ValueError, FileNotFoundError) as e:
         print(f"Configuration Error: {e}")
@@ -293,8 +933,13 @@ if __name__ == "__main__":
 
     error: bool = False
 
+    # Finds people missing from the records and duplicate responses
+    missing: set[str]
+    duplicated: set[str]
+    missing, duplicated = responses.validate(records)
+
     # Prints the missing people
-    if missing := responses.missing(records):
+    if missing:
         print("Users Who Do Not Exist In The Records:\n")
         for person in missing:
             print(person)
@@ -302,7 +947,7 @@ if __name__ == "__main__":
         error = True
 
     # Prints any duplicates
-    if duplicated := responses.duplicates():
+    if duplicated:
         print("Duplicates Found:\n")
         for duplicate in duplicated:
             print(duplicate)
@@ -313,8 +958,8 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Determine day
-    if args.day:
-        day: str = args.day.strip().title()
+    if arg_day:
+        day: str = arg_day.strip().title()
     else:
         day: str = input("Day To List: ").strip().title()
 
@@ -324,7 +969,7 @@ if __name__ == "__main__":
     debug, team = responses.availability(records, day)
 
     # Print the full dictionary
-    if args.verbose:
+    if verbose:
         print("DEBUG DATA:")
         for entry in debug:
             print(entry)
@@ -1,7 +1,12 @@
 import pytest
 import gspread
+import requests
 import json
+import pathlib
+import subprocess
+import sys
 from gvsu_snow_removal_scheduler import Sheet, read_config
+from gvsu_snow_removal_scheduler.main import _parse_args
 
 
 @pytest.fixture
@@ -90,24 +95,37 @@ def mock_records_data():
     ]
 
 
+def to_values(records):
+    """Converts records into the header row plus value rows the API returns."""
+    headers = list(records[0])
+    return [headers] + [
+        [str(record[header]) for header in headers] for record in records
+    ]
+
+
+def mock_response(code, message="mock"):
+    """Builds an HTTP error response for gspread APIErrors."""
+    response = requests.Response()
+    response.status_code = code
+    response._content = json.dumps(
+        {"error": {"code": code, "message": message}}
+    ).encode()
+    return response
+
+
 @pytest.fixture
 def mock_gspread(monkeypatch, mock_responses_data, mock_records_data):
     """Mocks the gspread interaction to return the data above."""
 
-    class MockWorksheet:
-        def __init__(self, data):
-            self._data = data
-
-        def get_all_records(self):
-            return self._data
-
     class MockSpreadsheet:
-        def worksheet(self, name):
-            if name == "Responses":
-                return MockWorksheet(mock_responses_data)
-            if name == "Records":
-                return MockWorksheet(mock_records_data)
-            raise gspread.exceptions.WorksheetNotFound
+        def values_get(self, range, params=None):
+            if range == "'Responses'":
+                return {"values": to_values(mock_responses_data)}
+            if range == "'Records'":
+                return {"values": to_values(mock_records_data)}
+            raise gspread.exceptions.APIError(
+                mock_response(400, f"Unable to parse range: {range}")
+            )
 
     class MockClient:
         def open(self, name):
@@ -118,6 +136,21 @@ def mock_gspread(monkeypatch, mock_responses_data, mock_records_data):
     monkeypatch.setattr("gspread.service_account", lambda filename: MockClient())
 
 
+@pytest.fixture
+def open_spreadsheet(monkeypatch):
+    """Mocks gspread so opening any sheet returns the given spreadsheet object."""
+
+    def use(spreadsheet):
+        class MockClient:
+            def open(self, name):
+                return spreadsheet
+
+        monkeypatch.setattr("gspread.service_account", lambda filename: MockClient())
+        return spreadsheet
+
+    return use
+
+
 def test_init_success(mock_responses_data):
     """Test successful initialization and data normalization via DI."""
     # Note: Normalization happens in update(), so if we inject raw data, we need to ensure it's normalized
@@ -130,6 +163,19 @@ def test_init_success(mock_responses_data):
     pass
 
 
+def test_import_without_gspread():
+    """Test that importing the package doesn't import gspread."""
+    code = "import sys, gvsu_snow_removal_scheduler; print('gspread' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(pathlib.Path(__file__).parent.parent / "src")},
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
 def test_init_with_data(mock_responses_data):
     """Test initializing with pre-populated data."""
     sheet = Sheet(data=mock_responses_data)
@@ -168,6 +214,138 @@ def test_update_errors(monkeypatch):
         sheet.update()
 
 
+def test_update_retries(open_spreadsheet, monkeypatch):
+    """Test that rate limited requests are retried with backoff."""
+    delays = []
+    monkeypatch.setattr("time.sleep", delays.append)
+
+    failures = [429, 503]
+
+    class MockSpreadsheet:
+        def values_get(self, range, params=None):
+            if failures:
+                raise gspread.exceptions.APIError(mock_response(failures.pop(0)))
+            return {"values": [["Name"], ["Leader Alice"]]}
+
+    open_spreadsheet(MockSpreadsheet())
+
+    sheet = Sheet("key.json", "Snow Data", "Records")
+    assert sheet.update()[0]["Name"] == "Leader Alice"
+    assert len(delays) == 2
+    assert 1 <= delays[0] < 2 <= delays[1] < 3
+
+    # Gives up once every attempt has failed
+    failures.extend([429] * 5)
+    with pytest.raises(gspread.exceptions.APIError):
+        sheet.update()
+    assert len(delays) == 6
+
+
+def test_update_only_replacement_dropped(open_spreadsheet):
+    """Test dropping Replacement when Name is the only other column."""
+
+    class MockSpreadsheet:
+        def values_get(self, range, params=None):
+            return {"values": [["Name", "Replacement"], ["Alice", True]]}
+
+    open_spreadsheet(MockSpreadsheet())
+
+    sheet = Sheet("key.json", "Snow Data", "Responses")
+    assert sheet.update() == [{"Name": "Alice", "_name_lc": "alice"}]
+
+
+def test_update_worksheet_not_found(mock_gspread):
+    """Test that a missing worksheet raises a readable error."""
+    sheet = Sheet("key.json", "Snow Data", "Schedule")
+    with pytest.raises(ValueError, match="Worksheet.*not found"):
+        sheet.update()
+
+
+def test_bad_request_not_worksheet(open_spreadsheet):
+    """Test that other bad requests aren't reported as a missing worksheet."""
+
+    class MockSpreadsheet:
+        def values_batch_update(self, body=None):
+            raise gspread.exceptions.APIError(
+                mock_response(400, "Range exceeds grid limits")
+            )
+
+    open_spreadsheet(MockSpreadsheet())
+
+    schedule = Sheet("key.json", "Snow Data", "Schedule")
+    with pytest.raises(gspread.exceptions.APIError, match="grid limits"):
+        schedule.write_team("Monday", ["Leader Alice"])
+
+
+def test_update_values(open_spreadsheet, monkeypatch):
+    """Test that rows are built from the formatted values, padding missing cells."""
+
+    class MockSpreadsheet:
+        def values_get(self, range, params=None):
+            return {
+                "values": [
+                    ["Name", "Completed", "Experience", "Position", "Timestamp"],
+                    ["Leader Alice", "5", "Varsity", "Leader", "1/5/2026 8:00:00"],
+                    ["Novice Dave", "1.5"],
+                    ["Varsity Bob", "1,234"],
+                ]
+            }
+
+    open_spreadsheet(MockSpreadsheet())
+
+    sheet = Sheet("key.json", "Snow Data", "Records")
+    sheet.update()
+
+    # Numbers are converted like get_all_records(), other text is left alone
+    assert sheet.sheet[0]["Completed"] == 5
+    assert sheet.sheet[0]["Timestamp"] == "1/5/2026 8:00:00"
+    assert sheet.sheet[1]["Completed"] == 1.5
+    assert sheet.sheet[1]["Position"] == ""
+    assert sheet.sheet[2]["Completed"] == 1234
+
+    # An empty worksheet has no values at all
+    monkeypatch.setattr(MockSpreadsheet, "values_get", lambda self, *a, **k: {})
+    assert sheet.update() == []
+
+
+def test_update_duplicate_headers(open_spreadsheet):
+    """Test that a repeated header raises instead of hiding a column."""
+
+    class MockSpreadsheet:
+        def values_get(self, range, params=None):
+            return {"values": [["Name", "Completed", "Name"], ["Alice", "1", "Bob"]]}
+
+    open_spreadsheet(MockSpreadsheet())
+
+    sheet = Sheet("key.json", "Snow Data", "Records")
+    with pytest.raises(ValueError, match="duplicate headers: Name"):
+        sheet.update()
+
+
+def test_update_cache(mock_gspread, monkeypatch, tmp_path):
+    """Test that a fresh cached worksheet is used instead of the API."""
+    cache_dir = str(tmp_path / "cache")
+    sheet = Sheet("key.json", "Snow Data", "Records", cache_ttl=60, cache_dir=cache_dir)
+    sheet.update()
+
+    monkeypatch.setattr(
+        "gspread.service_account",
+        lambda filename: (_ for _ in ()).throw(FileNotFoundError),
+    )
+
+    cached = Sheet(
+        "key.json", "Snow Data", "Records", cache_ttl=60, cache_dir=cache_dir
+    )
+    assert [r["Name"] for r in cached.update()] == [r["Name"] for r in sheet.sheet]
+
+    # An expired cache goes back to the API
+    expired = Sheet(
+        "key.json", "Snow Data", "Records", cache_ttl=0, cache_dir=cache_dir
+    )
+    with pytest.raises(FileNotFoundError):
+        expired.update()
+
+
 def test_duplicates(mock_responses_data):
     # Normalize the mock data to match what duplicates() expects (case sensitive check in duplicates logic?)
     # duplicates() uses "Name".
@@ -177,8 +355,37 @@ def test_duplicates(mock_responses_data):
     sheet = Sheet(data=mock_responses_data)
     dups = sheet.duplicates()
 
-    assert "Duplicate Dan" in dups or "duplicate dan" in dups
-    assert len(dups) == 1
+    assert dups == {"Duplicate Dan"}
+
+
+def test_validation_cached(mock_gspread, mock_responses_data, mock_records_data):
+    """Test that cached duplicates and missing results are reset on update()."""
+    responses = Sheet("key.json", "Snow Data", "Responses")
+    records = Sheet("key.json", "Snow Data", "Records")
+    responses.update()
+    records.update()
+
+    assert len(responses.duplicates()) == 1
+    assert responses.missing(records) == {"Missing Mike"}
+
+    mock_responses_data.pop()
+    mock_responses_data.pop()
+    mock_records_data.pop()
+
+    # Nothing changes until the sheets are updated
+    assert len(responses.duplicates()) == 1
+    assert responses.missing(records) == {"Missing Mike"}
+
+    records.update()
+    assert responses.missing(records) == {
+        "Missing Mike",
+        "Duplicate Dan",
+        "duplicate dan",
+    }
+
+    responses.update()
+    assert responses.duplicates() == set()
+    assert responses.missing(records) == {"Duplicate Dan"}
 
 
 def test_missing_people(mock_responses_data, mock_records_data):
@@ -192,6 +399,32 @@ def test_missing_people(mock_responses_data, mock_records_data):
     assert len(missing) == 1
 
 
+def test_categories_interned():
+    """Test that Position and Experience values are interned."""
+    # Built at runtime so the strings aren't already interned as literals
+    position = "".join(["Lead", "er"])
+    experience = "".join(["Vars", "ity"])
+    records = Sheet(
+        data=[{"Name": "Alice", "Position": position, "Experience": experience}]
+    )
+
+    assert records.sheet[0]["Position"] is sys.intern("Leader")
+    assert records.sheet[0]["Experience"] is sys.intern("Varsity")
+
+
+def test_validate(mock_responses_data, mock_records_data):
+    """Test that validate() matches missing() and duplicates()."""
+    responses = Sheet(data=mock_responses_data)
+    records = Sheet(data=mock_records_data)
+
+    missing, duplicated = responses.validate(records)
+
+    assert missing == {"Missing Mike"}
+    assert duplicated == {"Duplicate Dan"}
+    assert missing == Sheet(data=mock_responses_data).missing(records)
+    assert duplicated == Sheet(data=mock_responses_data).duplicates()
+
+
 def test_availability_basic_sorting(mock_responses_data, mock_records_data):
     """
     Test that the debug list is sorted by 'Completed' ascending.
@@ -244,6 +477,56 @@ def test_availability_team_logic(mock_responses_data, mock_records_data):
     assert "Novice Dave" not in team
 
 
+def test_records_index_cached(mock_gspread):
+    """Test that the records lookup is reused until the sheet is updated."""
+    records = Sheet("key.json", "Snow Data", "Records")
+    records.update()
+
+    index = records._get_index()
+    assert index["leader alice"]["Position"] == "Leader"
+    assert records._get_index() is index
+
+    records.update()
+    assert records._get_index() is not index
+
+
+def test_availability_other_day(mock_responses_data, mock_records_data):
+    """Test that only respondents available on the given day are listed."""
+    responses = Sheet(data=mock_responses_data)
+    records = Sheet(data=mock_records_data)
+
+    debug, team = responses.availability(records, "Wednesday")
+
+    assert [x["Name"] for x in debug] == ["Leader Alice"]
+    assert team == ["Leader Alice"]
+
+
+def test_availability_for_week(mock_responses_data, mock_records_data):
+    """Test that the weekly schedule matches availability() for each day."""
+    responses = Sheet(data=mock_responses_data)
+    records = Sheet(data=mock_records_data)
+
+    week = responses.availability_for_week(records)
+
+    assert list(week) == [
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+        "Sunday",
+    ]
+    assert week["Monday"] == responses.availability(records, "Monday")
+    assert week["Wednesday"] == responses.availability(records, "Wednesday")
+
+    # Tuesday has people but nobody who can lead, Thursday has nobody at all
+    tuesday_results, tuesday_team = week["Tuesday"]
+    assert [x["Name"] for x in tuesday_results] == ["Duplicate Dan", "duplicate dan"]
+    assert tuesday_team is None
+    assert week["Thursday"] == ([], None)
+
+
 def test_availability_no_leader():
     """Test that ValueError is raised if no leader is available."""
     bad_records = [
@@ -254,6 +537,8 @@ def test_availability_no_leader():
     responses = Sheet(data=bad_responses)
     records = Sheet(data=bad_records)
 
+    assert responses.sheet[0]["Days"] == frozenset({"Monday"})
+
     with pytest.raises(ValueError, match="No leader available"):
         responses.availability(records, "Monday")
 
@@ -266,7 +551,38 @@ def test_availability_invalid_day():
         responses.availability(records, "Funday")
 
 
-def test_read_config(tmp_path, monkeypatch):
+def test_write_team(open_spreadsheet):
+    """Test that a team is written in a single batch update."""
+    requests = []
+
+    class MockSpreadsheet:
+        def values_batch_update(self, body=None):
+            requests.append(body)
+
+    open_spreadsheet(MockSpreadsheet())
+
+    schedule = Sheet("key.json", "Snow Data", "Schedule")
+    schedule.write_team("Tuesday", ["Leader Alice", "Varsity Bob"])
+
+    assert len(requests) == 1
+    data = requests[0]["data"]
+    assert data[0] == {"range": "'Schedule'!B1", "values": [["Tuesday"]]}
+    assert data[2] == {"range": "'Schedule'!B3", "values": [["Varsity Bob"]]}
+    assert [cell["values"] for cell in data[3:]] == [[[""]]] * 4
+
+    with pytest.raises(ValueError, match="Invalid day"):
+        schedule.write_team("Funday", [])
+
+
+@pytest.fixture
+def fresh_config():
+    """Clears the cached config so each test reads its own file."""
+    read_config.cache_clear()
+    yield
+    read_config.cache_clear()
+
+
+def test_read_config(tmp_path, monkeypatch, fresh_config):
     """Test reading a valid config file."""
     config_data = {
         "api_key_path": "k.json",
@@ -283,7 +599,22 @@ def test_read_config(tmp_path, monkeypatch):
     assert config["sheet_name"] == "S"
 
 
-def test_read_config_missing(monkeypatch):
+def test_read_config_cached(tmp_path, monkeypatch, fresh_config):
+    """Test that the config file is only read once."""
+    p = tmp_path / "config.json"
+    p.write_text(json.dumps({"sheet_name": "S"}))
+
+    monkeypatch.chdir(tmp_path)
+
+    config = read_config()
+    p.write_text(json.dumps({"sheet_name": "Changed"}))
+    assert read_config() is config
+
+    read_config.cache_clear()
+    assert read_config()["sheet_name"] == "Changed"
+
+
+def test_read_config_missing(monkeypatch, fresh_config):
     """Test exception on missing config."""
     monkeypatch.setattr(
         "builtins.open",
@@ -294,6 +625,52 @@ def test_read_config_missing(monkeypatch):
         read_config()
 
 
+def test_parse_args():
+    """Test parsing the command line arguments."""
+    assert _parse_args([]) == (None, False)
+    assert _parse_args(["-d", "Monday", "-v"]) == ("Monday", True)
+    assert _parse_args(["--verbose", "--day", "tuesday"]) == ("tuesday", True)
+    assert _parse_args(["--day=Friday"]) == ("Friday", False)
+    assert _parse_args(["-dMonday"]) == ("Monday", False)
+    assert _parse_args(["-d=Monday"]) == ("Monday", False)
+    assert _parse_args(["-vd", "Monday"]) == ("Monday", True)
+    assert _parse_args(["-vdMonday"]) == ("Monday", True)
+    assert _parse_args(["--verb", "--da", "Sunday"]) == ("Sunday", True)
+    assert _parse_args(["--da=Sunday"]) == ("Sunday", False)
+
+
+def test_parse_args_errors(capsys):
+    """Test that help and invalid arguments exit like argparse."""
+    with pytest.raises(SystemExit) as excinfo:
+        _parse_args(["--help"])
+    assert excinfo.value.code == 0
+    assert "usage:" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit) as excinfo:
+        _parse_args(["-d"])
+    assert excinfo.value.code == 2
+
+    with pytest.raises(SystemExit) as excinfo:
+        _parse_args(["-d", "-v"])
+    assert excinfo.value.code == 2
+    assert "expects a day" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as excinfo:
+        _parse_args(["-vx"])
+    assert excinfo.value.code == 2
+    assert "-vx" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as excinfo:
+        _parse_args(["--verbose=yes"])
+    assert excinfo.value.code == 2
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as excinfo:
+        _parse_args(["--bogus"])
+    assert excinfo.value.code == 2
+    assert "--bogus" in capsys.readouterr().err
+
+
 @pytest.fixture
 def messy_responses_data():
     """Mock Responses with messy formatting for testing normalization."""
@@ -312,13 +689,9 @@ def messy_responses_data():
 def mock_gspread_messy(monkeypatch, messy_responses_data):
     """Mocks gspread to return messy data."""
 
-    class MockWorksheet:
-        def get_all_records(self):
-            return messy_responses_data
-
     class MockSpreadsheet:
-        def worksheet(self, name):
-            return MockWorksheet()
+        def values_get(self, range, params=None):
+            return {"values": to_values(messy_responses_data)}
 
     class MockClient:
         def open(self, name):
@@ -334,17 +707,19 @@ def test_days_normalization(mock_gspread_messy):
     sheet.update()
 
     alice = next(r for r in sheet.sheet if "Alice" in r["Name"])
-    assert alice["Days"] == [
-        "monday",
-        "Wednesday",
-        "friday",
-    ]
+    assert alice["Days"] == frozenset(
+        {
+            "monday",
+            "Wednesday",
+            "friday",
+        }
+    )
 
     bob = next(r for r in sheet.sheet if "Bob" in r["Name"])
-    assert bob["Days"] == ["Tuesday", "thursday"]
+    assert bob["Days"] == frozenset({"Tuesday", "thursday"})
 
     carol = next(r for r in sheet.sheet if "Carol" in r["Name"])
-    assert carol["Days"] == ["saturday", "SUNDAY"]
+    assert carol["Days"] == frozenset({"saturday", "SUNDAY"})
 
 
 def test_name_stripping(mock_gspread_messy):
@@ -356,6 +731,17 @@ def test_name_stripping(mock_gspread_messy):
     assert "  Leader Alice  " not in names
 
 
+def test_name_lookup_key(mock_gspread_messy):
+    """Test that the lowercased Name lookup key is set on fetched and injected rows."""
+    sheet = Sheet("key.json", "Snow Data", "Responses")
+    sheet.update()
+    assert "leader alice" in [r["_name_lc"] for r in sheet.sheet]
+
+    injected = Sheet(data=[{"Name": " Varsity Bob "}])
+    assert injected.sheet[0]["Name"] == "Varsity Bob"
+    assert injected.sheet[0]["_name_lc"] == "varsity bob"
+
+
 def test_replacement_removed(mock_gspread_messy):
     """Test that 'Replacement' field is removed."""
     sheet = Sheet("key.json", "Snow Data", "Responses")